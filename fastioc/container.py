@@ -5,20 +5,18 @@ Provides a dependency injection IoC container for registering and resolving
 dependencies with different lifetimes (singleton, request-scoped, transient) in FastAPI.
 """
 
-import sys
 import inspect
 from inspect import Parameter, Signature
 from typing import Any, Callable, Annotated, Optional, get_origin, get_args, cast
 from typeguard import typechecked, TypeCheckError
-from fastapi import FastAPI, APIRouter, Request, Response, BackgroundTasks, WebSocket, UploadFile
+from fastapi import FastAPI, APIRouter
 from fastapi.params import Depends
-from fastapi.security import SecurityScopes
 
 from fastioc.definitions import LifeTime, FastIoCConcrete, FastIoCDependency, Dependency, DEPENDENCIES
 from fastioc.errors import UnregisteredProtocolError, SingletonGeneratorError
-from fastioc.utils import (log, is_annotated_with_depends, pretend_signature_of, sort_parameters, clone_concrete,
-                          is_annotated_with_marker, resolve_forward_refs, check_singleton_dependency, warn_if_scoped_depends_transient
-                          , log_skip, log_builtin_protocol)
+from fastioc.utils import (log, pretend_signature_of, sort_parameters, replace_parameters, clone_concrete,
+                          is_annotated_with_marker, get_signature, get_class_hints, check_singleton_dependency, check_circular_dependency, warn_if_scoped_depends_transient
+                          , log_skip, log_builtin_protocol, SKIP_TYPES)
 
 
 class Container:
@@ -42,6 +40,7 @@ class Container:
 
         self.dependencies: dict[type, Depends] = {}
         self._singleton_cleanups: list[Callable[..., Any]] = []
+        self._singletons: dict[type, tuple[Callable[..., Any], FastIoCConcrete]] = {}
 
         log.debug('IoC/DI Container initialized ...')
 
@@ -73,18 +72,18 @@ class Container:
 
         for target in targets:
 
+            router: APIRouter = target if isinstance(target, APIRouter) else target.router
+
+            # Already injectified by this container: nothing to re-wrap or re-process
+            if getattr(router, '_fastioc_container', None) is self:
+                continue
+
             original_add_api_route: Callable[..., None]
 
-            if isinstance(target, FastAPI):
-                if getattr(target.router, '_add_api_route', None):
-                    original_add_api_route = target.router._add_api_route  # pyright: ignore[reportAttributeAccessIssue, reportUnknownVariableType, reportUnknownMemberType]
-                else:
-                    original_add_api_route = target.router.add_api_route
+            if getattr(router, '_add_api_route', None):
+                original_add_api_route = router._add_api_route  # pyright: ignore[reportAttributeAccessIssue, reportUnknownVariableType, reportUnknownMemberType]
             else:
-                if getattr(target, '_add_api_route', None):
-                    original_add_api_route = target._add_api_route  # pyright: ignore[reportAttributeAccessIssue, reportUnknownVariableType, reportUnknownMemberType]
-                else:
-                    original_add_api_route = target.add_api_route
+                original_add_api_route = router.add_api_route
 
             def injective_add_api_route_factory(original: Callable[..., None]) -> Callable[..., None]:
 
@@ -93,27 +92,27 @@ class Container:
 
                     # --- Check Endpoint Params ---
 
-                    signature = inspect.signature(endpoint)  # pyright: ignore[reportUnknownArgumentType]
-                    params: list[inspect.Parameter] = []
-
-                    for name, param in signature.parameters.items():  # pyright: ignore[reportUnusedVariable]
-                        if isinstance(param.default, Depends) or is_annotated_with_depends(param.annotation):
-                            params.append(param)
-                            continue
-                        if annotated_dependency := self._get_annotated_dependency_if_registered(param.annotation):
-                            new_param = param.replace(default=annotated_dependency)
-                            params.append(new_param)
-                            continue
-                        try:
-                            new_param = param.replace(default=self.resolve(param.annotation))
-                            params.append(new_param)
-
-                        except UnregisteredProtocolError:
-                            params.append(param)
-                            log_skip(param.annotation)
-
-                    params = sort_parameters(params)
-                    endpoint.__signature__ = signature.replace(parameters=params)  # pyright: ignore[reportFunctionMemberAccess]
+                    # Endpoints already processed by this container (e.g. re-added by `include_router`) keep their signature
+                    if getattr(endpoint, '_fastioc_container', None) is not self:
+                        signature = get_signature(endpoint)  # pyright: ignore[reportUnknownArgumentType]
+                        params: list[inspect.Parameter] = []
+                        injected = False
+
+                        for name, param in signature.parameters.items():  # pyright: ignore[reportUnusedVariable]
+                            if isinstance(param.default, Depends):
+                                params.append(param)
+                                continue
+                            if dependency := self._resolve_annotation(param.annotation):
+                                params.append(param.replace(default=dependency))
+                                injected = True
+                            else:
+                                params.append(param)
+                                log_skip(param.annotation)
+
+                        # Nothing injected: the original signature is kept as is
+                        if injected:
+                            endpoint.__signature__ = replace_parameters(signature, sort_parameters(params))  # pyright: ignore[reportFunctionMemberAccess]
+                        endpoint._fastioc_container = self  # pyright: ignore[reportFunctionMemberAccess]
 
 
                     # --- Route Level Dependencies ---
@@ -123,10 +122,9 @@ class Container:
 
                 return injective_add_api_route
 
-            router: APIRouter = target if isinstance(target, APIRouter) else target.router
-
             router.add_api_route = injective_add_api_route_factory(original_add_api_route)  # pyright: ignore[reportUnknownArgumentType, reportAttributeAccessIssue]
             router._add_api_route = original_add_api_route  # pyright: ignore[reportAttributeAccessIssue]
+            router._fastioc_container = self  # pyright: ignore[reportAttributeAccessIssue]
 
             # --- Router / Application Level Dependencies ---
             if hasattr(router, DEPENDENCIES) and router.dependencies:
@@ -160,13 +158,17 @@ class Container:
             lifetime = dependency.lifetime
         
         if lifetime is LifeTime.SINGLETON:
-            impl = self._initialize_singleton(implementation)
             def singleton_provider() -> Any:
-                return impl
+                return singleton_provider._fastioc_instance  # pyright: ignore[reportFunctionMemberAccess]
             singleton_provider._fastioc_singleton = True # pyright: ignore[reportFunctionMemberAccess]
+            singleton_provider._fastioc_instance = self._initialize_singleton(implementation) # pyright: ignore[reportFunctionMemberAccess]
+            # Re-registered protocols move to the end, keeping `reset_singletons` in registration order
+            self._singletons.pop(protocol, None)
+            self._singletons[protocol] = (singleton_provider, implementation)
             self.dependencies[protocol] = Depends(dependency=singleton_provider, use_cache=True)
         else:
             implementation = self._nested_injector(implementation, lifetime)
+            self._singletons.pop(protocol, None)
             self.dependencies[protocol] = Depends(dependency=implementation, use_cache = False if lifetime is LifeTime.TRANSIENT else True)
         log.debug('Dependency "%s" registered with "%s" lifetime for protocol: "%s"', implementation, lifetime, protocol)
         log_builtin_protocol(protocol, implementation)
@@ -178,7 +180,21 @@ class Container:
         """Return the Depends instance for a protocol. Raises ProtocolNotRegisteredError if not registered."""
         
         self.check_if_registered(protocol)
-        dependency: Depends = self.dependencies[protocol]
+        return cast(Depends, self.try_resolve(protocol))
+    
+
+    def try_resolve(self, protocol: type) -> Depends | None:
+
+        """
+        Return the Depends instance for a protocol, or None if it is not registered.
+
+        Same as `resolve`, but a missing protocol is reported by returning None
+        instead of raising ProtocolNotRegisteredError, so negative lookups stay cheap.
+        """
+
+        dependency: Depends | None = self.dependencies.get(protocol)
+        if dependency is None:
+            return None
         log.debug('Resolve called for protocol "%s"', protocol)
 
         if hooked_dependency := self.before_resolve_hook(dependency):
@@ -186,6 +202,25 @@ class Container:
             return hooked_dependency
         
         return dependency
+
+
+    def get_singleton(self, protocol: type) -> Any:
+
+        """
+        Return the instance of a registered singleton dependency.
+
+        Unlike `resolve(protocol).dependency()`, this bypasses `before_resolve_hook`
+        and always returns the instance currently stored by the container.
+
+        Raises:
+            UnregisteredProtocolError: If the protocol is not registered as a singleton.
+        """
+
+        entry = self._singletons.get(protocol)
+        if entry is None:
+            raise UnregisteredProtocolError(
+                f"Protocol {protocol.__name__} is not registered as a singleton in the container")
+        return entry[0]._fastioc_instance  # pyright: ignore[reportFunctionMemberAccess]
     
     
     @typechecked
@@ -370,6 +405,27 @@ class Container:
                 log.exception('Error disposing "%s": %s', name, exception) # pyright: ignore[reportUnknownArgumentType]
 
 
+    # --- Reset
+
+    def reset_singletons(self):
+
+        """
+        Re-create all singleton instances, keeping every registration.
+
+        Singletons are re-initialized in registration order, so nested singletons
+        receive the new instances. Useful to isolate tests that share one container.
+
+        Notes:
+            - Existing instances are NOT disposed; call `dispose` first if they hold resources.
+            - Only disposal functions of the new instances are kept for later `dispose` calls.
+        """
+
+        self._singleton_cleanups.clear()
+        for provider, implementation in self._singletons.values():
+            provider._fastioc_instance = self._initialize_singleton(implementation)  # pyright: ignore[reportFunctionMemberAccess]
+        log.debug('Singleton dependencies reset')
+
+
     # --- Internal helper functions
     
     @typechecked
@@ -381,13 +437,18 @@ class Container:
         """
 
         hint_params: list[Parameter] = []
-        signature: Signature = inspect.signature(implementation.__init__) if inspect.isclass(implementation) else inspect.signature(implementation)
-        hints: Optional[dict[str, Any]] = resolve_forward_refs(implementation.__annotations__, vars(sys.modules[implementation.__module__]), dict(vars(implementation))) if inspect.isclass(implementation) else None
+        signature: Signature = get_signature(implementation.__init__) if inspect.isclass(implementation) else get_signature(implementation)
+        hints: Optional[dict[str, Any]] = get_class_hints(implementation) if inspect.isclass(implementation) else None
+        parameters = signature.parameters
+        resolve_annotation = self._resolve_annotation
+        # A cycle can only close through an implementation that was already injected (and may be depended on)
+        reinjected: bool = getattr(implementation, '__dict__', {}).get('_fastioc_injected', False)
+        seen: set[int] = set()
         if hints:
             for name, annotation in hints.items():
-                if name in signature.parameters or hasattr(implementation, name):
+                if name in parameters or hasattr(implementation, name):
                     continue
-                if annotation in (Request, Response, BackgroundTasks, WebSocket, UploadFile, SecurityScopes) or is_annotated_with_marker(annotation):
+                if annotation in SKIP_TYPES or is_annotated_with_marker(annotation):
                     hint_params.append(Parameter(
                         name=name,
                         kind=Parameter.POSITIONAL_OR_KEYWORD,
@@ -395,66 +456,53 @@ class Container:
                     ))
                     log.debug('Resolved FastAPI built-in "%s" as nested dependency for "%s"', annotation, implementation)
                     continue
-                if annotated_dependency := self._get_annotated_dependency_if_registered(annotation):
-                    hint_params.append(Parameter(
-                        name=name,
-                        kind=Parameter.POSITIONAL_OR_KEYWORD,
-                        annotation=annotation,
-                        default=annotated_dependency
-                    ))
-                    warn_if_scoped_depends_transient(annotated_dependency, lifetime, implementation)
-                    log.debug('Resolved Protocol "%s" as nested dependency for "%s" (from class annotations)', annotation, implementation)
-                    continue
-                try:
-                    dependency: Depends = self.resolve(annotation)
+                if dependency := resolve_annotation(annotation):
                     hint_params.append(Parameter(
                         name=name,
                         kind=Parameter.POSITIONAL_OR_KEYWORD,
                         annotation=annotation,
                         default=dependency
                     ))
+                    if reinjected:
+                        check_circular_dependency(dependency, implementation, seen)
                     warn_if_scoped_depends_transient(dependency, lifetime, implementation)
                     log.debug('Resolved Protocol "%s" as nested dependency for "%s" (from class annotations)', annotation, implementation)
-                except UnregisteredProtocolError:
+                else:
                     log_skip(annotation, True)
         
         params: list[Parameter] = []
-        for name, param in signature.parameters.items():
+        for name, param in parameters.items():
             if name == 'self':
                 continue
             annotation = param.annotation
             if annotation != Signature.empty:
-                if isinstance(param.default, Depends) or is_annotated_with_depends(annotation):
+                if isinstance(param.default, Depends):
                     params.append(param)
                     continue
-                if annotated_dependency := self._get_annotated_dependency_if_registered(annotation):
-                    new_param = param.replace(default=annotated_dependency)
-                    params.append(new_param)
-                    warn_if_scoped_depends_transient(annotated_dependency, lifetime, implementation)
-                    log.debug('Resolved Protocol "%s" as nested dependency for "%s"', annotation, implementation)
-                    continue
-                try:
-                    dependency = self.resolve(annotation)
-                    new_param = param.replace(default=dependency)
-                    params.append(new_param)
+                if dependency := resolve_annotation(annotation):
+                    params.append(param.replace(default=dependency))
+                    if reinjected:
+                        check_circular_dependency(dependency, implementation, seen)
                     warn_if_scoped_depends_transient(dependency, lifetime, implementation)
                     log.debug('Resolved Protocol "%s" as nested dependency for "%s"', annotation, implementation)
-                except UnregisteredProtocolError:
+                else:
                     log_skip(annotation, True)
                     params.append(param)
         params.extend(hint_params)
         params = sort_parameters(params)
         implementation.__signature__ = signature.replace(parameters=params)  # pyright: ignore[reportFunctionMemberAccess]
+        implementation._fastioc_injected = True  # pyright: ignore[reportFunctionMemberAccess, reportAttributeAccessIssue]
 
 
         if hint_params:
             implementation = clone_concrete(implementation)
             original_init = implementation.__init__
+            hint_names = tuple(param.name for param in hint_params)
             def __init__(_self: object, *args: Any, **kwargs: Any):
 
-                for param in hint_params:
-                    if param.name in kwargs: 
-                        setattr(_self, param.name, kwargs.pop(param.name, None))
+                for name in hint_names:
+                    if name in kwargs:
+                        setattr(_self, name, kwargs.pop(name))
 
                 original_init(_self, *args, **kwargs)  # pyright: ignore[reportCallIssue]
 
@@ -468,43 +516,33 @@ class Container:
         """
 
         hint_args: dict[str, Any] = {}
-        signature: Signature = inspect.signature(implementation.__init__) if inspect.isclass(implementation) else inspect.signature(implementation)
-        hints: Optional[dict[str, Any]] = resolve_forward_refs(implementation.__annotations__, vars(sys.modules[implementation.__module__]), dict(vars(implementation))) if inspect.isclass(implementation) else None
+        signature: Signature = get_signature(implementation.__init__) if inspect.isclass(implementation) else get_signature(implementation)
+        hints: Optional[dict[str, Any]] = get_class_hints(implementation) if inspect.isclass(implementation) else None
+        parameters = signature.parameters
+        resolve_annotation = self._resolve_annotation
 
         if hints:
             for name, annotation in hints.items():
-                if name in signature.parameters or hasattr(implementation, name):
-                    continue
-                if annotated_dependency := self._get_annotated_dependency_if_registered(annotation):
-                    check_singleton_dependency(annotated_dependency, implementation)
-                    hint_args[name] = annotated_dependency.dependency() # pyright: ignore[reportOptionalCall]
-                    log.debug('Resolved "%s" protocol as nested dependency for "%s" (from class annotations)', annotation, implementation)
+                if name in parameters or hasattr(implementation, name):
                     continue
-                try:
-                    dependency: Depends = self.resolve(annotation)
+                if dependency := resolve_annotation(annotation):
                     check_singleton_dependency(dependency, implementation)
-                    hint_args[name] = dependency.dependency()  # pyright: ignore[reportOptionalCall]
+                    hint_args[name] = dependency.dependency._fastioc_instance  # pyright: ignore[reportOptionalMemberAccess, reportFunctionMemberAccess]
                     log.debug('Resolved "%s" protocol as nested dependency for "%s" (from class annotations)', annotation, implementation)
-                except UnregisteredProtocolError:
+                else:
                     log_skip(annotation, True)
 
         args: dict[str, Any] = {}
-        for name, param in signature.parameters.items():
+        for name, param in parameters.items():
             if name == 'self':
                 continue
             annotation = param.annotation
             if annotation != Signature.empty:
-                if annotated_dependency := self._get_annotated_dependency_if_registered(annotation):
-                    check_singleton_dependency(annotated_dependency, implementation)
-                    args[name] = annotated_dependency.dependency() # pyright: ignore[reportOptionalCall]
-                    log.debug('Resolved "%s" protocol as nested dependency for "%s"', annotation, implementation)
-                    continue
-                try:
-                    dependency = self.resolve(annotation)
+                if dependency := resolve_annotation(annotation):
                     check_singleton_dependency(dependency, implementation)
-                    args[name] = dependency.dependency()  # pyright: ignore[reportOptionalCall]
+                    args[name] = dependency.dependency._fastioc_instance  # pyright: ignore[reportOptionalMemberAccess, reportFunctionMemberAccess]
                     log.debug('Resolved "%s" protocol as nested dependency for "%s"', annotation, implementation)
-                except UnregisteredProtocolError:
+                else:
                     log_skip(annotation, True)
 
         impl = implementation(**args)
@@ -533,15 +571,13 @@ class Container:
         - If the type is not registered in the container, append the item itself.
         """
 
-        if isinstance(item, Depends) or is_annotated_with_depends(item):
+        if isinstance(item, Depends):
             _list.append(item)
             return
 
-        try:
-            dependency: Depends = self.resolve(item)
+        if dependency := self._resolve_annotation(item):
             _list.append(dependency)
-
-        except UnregisteredProtocolError:
+        else:
             _list.append(item)
             log_skip(item)
     
@@ -562,27 +598,27 @@ class Container:
         return _list
     
 
-    def _get_annotated_dependency_if_registered(self, annotation: Any) -> Depends | None:
+    def _resolve_annotation(self, annotation: Any) -> Depends | None:
 
         """
-        Attempts to resolve a dependency from the container if the given annotation
-        is an Annotated type with a registered dependency.
+        Classify and resolve a type annotation in a single pass.
+
+        `get_origin` / `get_args` are queried once per annotation:
+        - `Annotated[..., Depends(...)]`: an explicit FastAPI dependency; returns None so it is left as-is.
+        - `Annotated[..., <Protocol>]`: returns the first registered protocol among the extras.
+        - Otherwise the annotation itself is resolved from the container.
 
-        Returns the first resolved dependency if found (stops at the first match),
-        otherwise None.
+        Returns None if no registered dependency is found.
         """
 
-        dependency = None
         if get_origin(annotation) is Annotated:
             mainType, *extras = get_args(annotation)  # pyright: ignore[reportUnusedVariable]
+            if any(isinstance(extra, Depends) for extra in extras):
+                return None
             for extra in extras:
-                if isinstance(extra, type):
-                    try:
-                        dependency = self.resolve(extra)
-                        break
-                    except UnregisteredProtocolError:
-                        continue
-        return dependency
+                if isinstance(extra, type) and (dependency := self.try_resolve(extra)):
+                    return dependency
+        return self.try_resolve(annotation)
 
     # --- Hooks ---
 
@@ -6,7 +6,7 @@ and supports full dependency injection for both controllers and their endpoints.
 Make sure to include a valid `container` in the controller's config.
 """
 
-import inspect
+from typing import Any, Callable, Iterator, Optional
 
 from fastapi_controllers.definitions import WebsocketRouteMeta, Route, HTTPRouteMeta  # pyright: ignore[reportMissingTypeStubs]
 from fastapi_controllers.helpers import _replace_signature  # pyright: ignore[reportUnknownVariableType, reportPrivateUsage, reportMissingTypeStubs]
@@ -16,6 +16,53 @@ from fastioc.controller.definitions import APIRouterParams
 from fastioc.container import Container
 from fastioc.definitions import LifeTime
 
+
+def _iter_routes(cls: type) -> Iterator[tuple[str, Route]]:
+
+    """
+    Yield `(name, route)` for every route visible on a controller class.
+
+    Walks the class dicts along the MRO directly (subclass definitions shadow base ones),
+    instead of `inspect.getmembers`, which does a `getattr` for every attribute in `dir(cls)`.
+    """
+
+    seen: set[str] = set()
+    for klass in cls.__mro__:
+        for name, value in vars(klass).items():
+            if name.startswith('__') or name in seen:
+                continue
+            seen.add(name)
+            if isinstance(value, Route):
+                yield name, value
+
+
+_RouteEntry = tuple[Callable[..., Any], str, tuple[Any, ...], dict[str, Any]]
+"""`(endpoint, path, extra positional args, keyword args)` ready to be passed to the router."""
+
+def _get_routes(cls: type) -> tuple[list[_RouteEntry], list[_RouteEntry]]:
+
+    """
+    Return the `(http, websocket)` routes declared on a controller class, each ordered by name.
+
+    Routes are fixed at class definition time, so they are discovered, classified and have
+    their router arguments merged once per class; the result is cached on the class itself
+    (`_fastioc_routes`), so it lives and dies with the class.
+    """
+
+    routes: tuple[list[_RouteEntry], list[_RouteEntry]] | None = cls.__dict__.get('_fastioc_routes')
+    if routes is None:
+        http_routes: list[_RouteEntry] = []
+        websocket_routes: list[_RouteEntry] = []
+        for _, route in sorted(_iter_routes(cls), key=lambda item: item[0]):
+            if isinstance(route.route_meta, HTTPRouteMeta):
+                http_routes.append((route.endpoint, route.route_args[0], route.route_args[1:], {'methods': [route.route_meta.request_method], **route.route_kwargs}))
+            if isinstance(route.route_meta, WebsocketRouteMeta):
+                websocket_routes.append((route.endpoint, route.route_args[0], route.route_args[1:], route.route_kwargs))
+        routes = (http_routes, websocket_routes)
+        setattr(cls, '_fastioc_routes', routes)
+    return routes
+
+
 class APIController:
 
     """
@@ -54,7 +101,7 @@ class APIController:
     config: APIRouterParams = {}
 
     @classmethod
-    def router(cls, config: APIRouterParams = {}) -> APIRouter:  # pyright: ignore[reportRedeclaration]
+    def router(cls, config: Optional[APIRouterParams] = None) -> APIRouter:  # pyright: ignore[reportRedeclaration]
         """
         Create a new FastIoc APIRouter instance and populate it with APIRoutes.
 
@@ -66,27 +113,19 @@ class APIController:
             APIRouter: An instance of fastioc.integrations.APIRouter with routes registered.
         """
 
-        config = {**cls.config, **config}
-        container = config['container'] or Container() # pyright: ignore[reportTypedDictNotRequiredAccess]
+        config = cls.config if config is None else {**cls.config, **config}
+        container = config.get('container') or Container()
 
         controller: type['APIController'] = container._nested_injector(cls, lifetime=LifeTime.SINGLETON)  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType, reportAssignmentType, reportPrivateUsage]
         
-        router = APIRouter(**(config or {}))  # pyright: ignore[reportCallIssue]
-        for _, route in inspect.getmembers(controller, predicate=lambda r: isinstance(r, Route)):
-            _replace_signature(controller, route.endpoint)
-            if isinstance(route.route_meta, HTTPRouteMeta):
-                router.add_api_route(
-                    route.route_args[0],
-                    route.endpoint,
-                    *route.route_args[1:],
-                    methods=[route.route_meta.request_method],
-                    **route.route_kwargs,
-                )
-            if isinstance(route.route_meta, WebsocketRouteMeta):
-                router.add_api_websocket_route(
-                    route.route_args[0],
-                    route.endpoint,
-                    *route.route_args[1:],
-                    **route.route_kwargs,
-                )
+        router = APIRouter(**{**config, 'container': container})  # pyright: ignore[reportCallIssue]
+        http_routes, websocket_routes = _get_routes(cls)
+        for endpoint, *_ in (*http_routes, *websocket_routes):
+            if getattr(endpoint, '_fastioc_controller', None) is not controller:
+                _replace_signature(controller, endpoint)
+                endpoint._fastioc_controller = controller  # pyright: ignore[reportFunctionMemberAccess]
+        for endpoint, path, args, kwargs in http_routes:
+            router.add_api_route(path, endpoint, *args, **kwargs)
+        for endpoint, path, args, kwargs in websocket_routes:
+            router.add_api_websocket_route(path, endpoint, *args, **kwargs)
         return router
\ No newline at end of file
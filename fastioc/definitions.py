@@ -28,7 +28,7 @@ FastIoCDependency = type | Depends
 D = TypeVar('D')
 
 
-@dataclass
+@dataclass(slots=True)
 class Dependency(Generic[D]):
     """
     Represents a dependency to be registered in the DI container.
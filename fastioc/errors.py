@@ -40,4 +40,15 @@ class SingletonLifetimeViolationError(FastIoCError):
     request or per resolution. Injecting shorter-lived dependencies into a
     singleton may lead to captured request state, invalid references, or memory leaks.
     """
-    pass
\ No newline at end of file
+    pass
+
+
+class CircularDependencyError(FastIoCError):
+    """
+    Raised when a dependency would (directly or transitively) depend on itself.
+
+    This can only happen when a protocol is re-registered with an implementation
+    whose nested dependencies already resolve back to it. FastAPI would otherwise
+    recurse forever while building the dependency tree of the first route using it.
+    """
+    pass
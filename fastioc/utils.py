@@ -2,8 +2,9 @@
 A set of helper utilities used internally by the FastIoC library.
 """
 import logging
-from typing import Any, Callable, TypeVar, Annotated, get_args, get_origin, ForwardRef
-from inspect import Parameter
+from weakref import WeakKeyDictionary
+from typing import Any, Callable, TypeVar, Annotated, get_args, get_origin
+from inspect import Parameter, Signature
 import types
 import inspect
 
@@ -13,7 +14,7 @@ from fastapi.security import SecurityScopes
 from pydantic import BaseModel
 
 from fastioc.definitions import FastIoCConcrete, LifeTime
-from fastioc.errors import SingletonLifetimeViolationError
+from fastioc.errors import SingletonLifetimeViolationError, CircularDependencyError
 
 log = logging.getLogger('FastIoC')
 if not log.handlers:
@@ -24,6 +25,9 @@ if not log.handlers:
 
 T = TypeVar('T')
 
+def _identity(f: Any) -> Any:
+    return f
+
 def pretend_signature_of(func: T) -> Callable[[Any], T]:
 
     """
@@ -32,7 +36,7 @@ def pretend_signature_of(func: T) -> Callable[[Any], T]:
     (Used only for type checkers; no runtime effect.)
     """
     
-    return lambda f: f
+    return _identity
 
 
 def is_annotated_with(annotation: Any, *markers: Any) -> bool:
@@ -101,8 +105,25 @@ def sort_parameters(params: list[Parameter]) -> list[Parameter]:
     
     return sorted(params, key=key)
 
+def replace_parameters(signature: Signature, params: list[Parameter]) -> Signature:
+
+    """
+    Build a copy of `signature` with `params`, skipping `Signature` validation.
+
+    Only safe when `params` come from a valid signature, were passed through
+    `sort_parameters`, and only gained defaults: the result is then valid by construction,
+    and re-checking every parameter kind, default and name on each endpoint is pure overhead.
+    """
+
+    return type(signature)(params, return_annotation=signature.return_annotation, __validate_parameters__=False)  # pyright: ignore[reportCallIssue]
+
 def clone_function(func: types.FunctionType) -> types.FunctionType:
-    """Clone a Python function (sync, async, or generator)."""
+    """
+    Clone a Python function (sync, async, or generator).
+
+    A real function object is rebuilt from `func.__code__` (instead of wrapping `func`),
+    so FastAPI still detects coroutine / generator functions on the clone.
+    """
     clone = types.FunctionType(
         func.__code__,
         func.__globals__,
@@ -110,9 +131,14 @@ def clone_function(func: types.FunctionType) -> types.FunctionType:
         argdefs=func.__defaults__,
         closure=func.__closure__,
     )
-    clone.__dict__.update(func.__dict__)
-    clone.__annotations__ = func.__annotations__.copy() if func.__annotations__ else {}
-    clone.__kwdefaults__ = func.__kwdefaults__.copy() if func.__kwdefaults__ else None
+    if func.__dict__:
+        clone.__dict__.update(func.__dict__)
+    if func.__annotations__:
+        clone.__annotations__ = func.__annotations__.copy()
+    if func.__kwdefaults__:
+        clone.__kwdefaults__ = func.__kwdefaults__.copy()
+    if '__signature__' not in clone.__dict__:
+        clone.__signature__ = inspect.signature(func)  # pyright: ignore[reportFunctionMemberAccess]
     clone.__doc__ = func.__doc__
     clone.__module__ = func.__module__
     clone.__qualname__ = func.__qualname__
@@ -124,7 +150,9 @@ def clone_class(cls: type) -> type:
     namespace = dict(cls.__dict__)
     namespace.pop("__dict__", None)
     namespace.pop("__weakref__", None)
+    signature = namespace.pop('__signature__', None) or inspect.signature(cls)
     clone = type(cls.__name__, cls.__bases__, namespace)
+    clone.__signature__ = signature  # pyright: ignore[reportAttributeAccessIssue]
     clone.__module__ = cls.__module__
     clone.__doc__ = cls.__doc__
     clone.__qualname__ = cls.__qualname__
@@ -136,6 +164,9 @@ def clone_concrete(impl: Any) -> Any:
     Clone either a function or a class.
     - Preserves async / generator / closure for functions
     - Preserves methods/attributes for classes
+
+    The clone always carries an explicit `__signature__`, so later `inspect.signature`
+    calls (e.g. by FastAPI) return it directly instead of reflecting on the clone.
     """
     if inspect.isfunction(impl):
         return clone_function(impl)
@@ -145,35 +176,57 @@ def clone_concrete(impl: Any) -> Any:
         raise TypeError(f"Unsupported implementation type: {type(impl)}")
     
 
-def resolve_forward_refs(annotation: Any, globalns: dict[Any, Any], localns: dict[Any, Any]) -> Any:
-    
+def _evaluate_annotation(annotation: Any, globalns: dict[str, Any], localns: dict[str, Any] | None = None) -> Any:
+    if not isinstance(annotation, str):
+        return annotation
+    try:
+        return eval(annotation, globalns, localns)
+    except (NameError, AttributeError):
+        return annotation
+
+def get_signature(func: Callable[..., Any]) -> Signature:
+
+    """
+    Return the signature of `func` with string parameter annotations evaluated.
+
+    Supports modules using `from __future__ import annotations`, including signatures
+    already replaced through `__signature__` (e.g. controller endpoints).
+    Each annotation is evaluated on its own; one that cannot be resolved (e.g. imported only
+    under `TYPE_CHECKING`, or a class defined inside a function) is left as a string and skipped.
     """
-    Recursively resolves forward references in type annotations.
 
-    Handles:
-    - ForwardRef strings
-    - Generic types (e.g., List[T], Dict[K, V])
-    - Annotated types
+    signature = inspect.signature(func)
+    if not any(isinstance(param.annotation, str) for param in signature.parameters.values()):
+        return signature
+
+    globalns = getattr(inspect.unwrap(func), '__globals__', {})
+    return signature.replace(parameters=[
+        param.replace(annotation=_evaluate_annotation(param.annotation, globalns))
+        for param in signature.parameters.values()
+    ])
+
+_class_hints_cache: WeakKeyDictionary[type, dict[str, Any]] = WeakKeyDictionary()
+
+def get_class_hints(cls: type) -> dict[str, Any]:
 
-    Returns the annotation with all forward references replaced by actual types.
     """
+    Return the class-level annotations of `cls` with string annotations evaluated.
 
-    origin = get_origin(annotation)
+    Unresolvable annotations are left as strings, as in `get_signature`.
+    Class annotations do not change after definition, so a fully evaluated result is cached per class
+    (the container reads them on every registration and on every `APIController.router()` call);
+    a partial one is not, since the missing names may be defined later.
+    """
 
-    if origin is Annotated:
-        base, *extras = get_args(annotation)
-        resolved_base = resolve_forward_refs(base, globalns, localns)
-        return Annotated[resolved_base, *extras]
-    
-    if origin is not None: # Generic
-        args = get_args(annotation)
-        resolved_args = tuple(resolve_forward_refs(a, globalns, localns) for a in args)
-        return origin[resolved_args]
-    
-    if isinstance(annotation, str):
-        return ForwardRef(annotation)._evaluate(globalns, localns)  # pyright: ignore[reportUnknownVariableType, reportCallIssue]
-    
-    return annotation
+    hints = _class_hints_cache.get(cls)
+    if hints is None:
+        module = inspect.getmodule(cls)
+        globalns: dict[str, Any] = vars(module) if module else {}
+        localns = dict(vars(cls))
+        hints = {name: _evaluate_annotation(annotation, globalns, localns) for name, annotation in inspect.get_annotations(cls).items()}
+        if not any(isinstance(annotation, str) for annotation in hints.values()):
+            _class_hints_cache[cls] = hints
+    return hints
 
 def check_singleton_dependency(dependency: Depends, parent: FastIoCConcrete):
 
@@ -184,14 +237,48 @@ def check_singleton_dependency(dependency: Depends, parent: FastIoCConcrete):
     if not getattr(dependency.dependency, '_fastioc_singleton', False):
         raise SingletonLifetimeViolationError(f'Singleton dependency "{parent}" cannot depend on request-scoped/transient dependency "{dependency.dependency}"')
     
+def check_circular_dependency(dependency: Depends, parent: FastIoCConcrete, seen: set[int]):
+
+    """
+    Raises error if a dependency (transitively) depends on its parent.
+
+    Walks the `Depends` defaults of the already injected signatures iteratively.
+    `seen` holds the ids of callables already walked; share it across all dependencies of one
+    parent, so each callable is visited at most once per registration.
+    """
+
+    stack: list[Any] = [dependency.dependency]
+    while stack:
+        call = stack.pop()
+        if call is parent:
+            raise CircularDependencyError(f'Dependency "{parent}" cannot depend on "{dependency.dependency}", which depends on "{parent}" itself')
+        if id(call) in seen:
+            continue
+        seen.add(id(call))
+        try:
+            params = inspect.signature(call).parameters.values()
+        except (TypeError, ValueError):
+            continue
+        stack.extend(param.default.dependency for param in params if isinstance(param.default, Depends))
+
+LIFETIME_WARNINGS: dict[tuple[LifeTime, bool], str] = {
+    (LifeTime.SCOPED, False): 'Request-scoped dependency "%s" depends on transient dependency "%s"',
+}
+"""
+Warning messages for parent/child lifetime relations, keyed by `(parent lifetime, child use_cache)`.
+(A non-cached child is a transient dependency.)
+"""
+
 def warn_if_scoped_depends_transient(dependency: Depends, lifetime: LifeTime, parent: FastIoCConcrete):
 
     """
     Logs a warning if a request-scoped dependency depends on a transient dependency.
     """
 
-    if lifetime is LifeTime.SCOPED and not dependency.use_cache:
-        log.warning('Request-scoped dependency "%s" depends on transient dependency "%s"', parent, dependency.dependency)
+    if not log.isEnabledFor(logging.WARNING):
+        return
+    if message := LIFETIME_WARNINGS.get((lifetime, dependency.use_cache)):
+        log.warning(message, parent, dependency.dependency)
 
 
 SKIP_TYPES: set[Any] = {
@@ -203,8 +290,10 @@ SKIP_TYPES: set[Any] = {
     SecurityScopes
 }
 
-def log_skip(annotation: type, nested: bool = False):
-    if not annotation in SKIP_TYPES and not isinstance(annotation, BaseModel) and not is_annotated_with_marker(annotation) and not annotation.__module__ in ('builtins', 'typing'):
+def log_skip(annotation: Any, nested: bool = False):
+    if isinstance(annotation, str):
+        log.info(('(Nested)' if nested else '') + 'Skipped annotation "%s": Name could not be resolved', annotation)
+    elif not annotation in SKIP_TYPES and not isinstance(annotation, BaseModel) and not is_annotated_with_marker(annotation) and not getattr(annotation, '__module__', None) in ('builtins', 'typing'):
         log.info(('(Nested)' if nested else '') + 'Skipped protocol "%s": No registered dependency found', annotation)
 
 def log_builtin_protocol(annotation: type, dependency: FastIoCConcrete):
@@ -17,12 +17,13 @@ from .dependencies import (State, state as _state, IGlobalService, INumberServic
                             LifetimeServiceScoped, LifetimeServiceFactory, IGlobalService2, GlobalService2,
                             INumberService2, NumberService2, ExtraText, get_extra_text, DeepService,
                             DeeperSerivce, IDisposable, Disposable, ISingletonNestedService,
-                            ISingletonNumberService2, SingletonNestedService)
+                            ISingletonNumberService2, SingletonNestedService,
+                            IPartialService, PartialService)
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def container():
-    """Provide a DI container with common test dependencies registered."""
+    """Provide a DI container with common test dependencies registered (shared, reset per test)."""
     container = Container()
     # General (Injection)
     container.add_scoped(INumberService, NumberService)
@@ -48,6 +49,7 @@ def container():
     container.add_scoped(DeeperSerivce, DeeperSerivce)
     container.add_scoped(DeepService, DeepService)
     container.add_scoped(ExtraText, get_extra_text)
+    container.add_scoped(IPartialService, PartialService)
     # Dispose
     container.add_singleton(IDisposable, Disposable)
 
@@ -79,5 +81,6 @@ def state() -> State:
 
 
 @pytest.fixture(autouse=True)
-def reset(state: State):
+def reset(state: State, container: Container):
     state.reset()
+    container.reset_singletons()
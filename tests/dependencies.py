@@ -1,14 +1,19 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import Protocol, Generator, Annotated, Optional
+from typing import TYPE_CHECKING, Protocol, Generator, Annotated
 
 from fastapi import Depends, Request, Cookie, BackgroundTasks
 
 from .constants import *
 
+if TYPE_CHECKING:
+    from decimal import Decimal  # Only for type checkers; unresolvable at runtime
+
 # --- State ---
 
 
-@dataclass
+@dataclass(slots=True)
 class State:
     global_service_number: int = 0
     global_service_number_2: int = 0
@@ -21,17 +26,9 @@ class State:
     background_number: int = 0
     dispose_number: int = 0
 
-    _instance: Optional['State'] = None
-
-    @classmethod
-    def get(cls) -> 'State':
-        if cls._instance == None:
-            cls._instance = cls()
-        return cls._instance
-
-    @classmethod
-    def reset(cls):
-        cls._instance = cls()
+    def reset(self):
+        # Reinitialize in place, so every module holding `state` sees the defaults
+        self.__init__()
 
 
 state = State()
@@ -58,7 +55,7 @@ class IGlobalService(Protocol):
 
 class GlobalService(IGlobalService):
     def __init__(self) -> None:
-        state.get().global_service_number = GLOBAL_SERVICE_NUMBER
+        state.global_service_number = GLOBAL_SERVICE_NUMBER
 
 
 # --- Function Based Depedencies ---
@@ -76,11 +73,11 @@ class GlobalFunctionNumber(int):
 
 
 def set_global_function_number():
-    state.get().global_direct_number = GLOBAL_FUNCTION_NUMBER
+    state.global_direct_number = GLOBAL_FUNCTION_NUMBER
 
 
 def set_global_usual_number():
-    state.get().global_usual_number = GLOBAL_USUAL_NUMBER
+    state.global_usual_number = GLOBAL_USUAL_NUMBER
 
 
 class GeneratorDependencyType(int):
@@ -91,7 +88,7 @@ def generator_dependency() -> Generator[int, None, None]:
     try:
         yield GENERATOR_NUMBER
     finally:
-        state.get().generator_exit_number = GENERATOR_EXIT_NUMBER
+        state.generator_exit_number = GENERATOR_EXIT_NUMBER
 
 
 # --- Nested Dependencies ---
@@ -159,7 +156,7 @@ class IGlobalNestedNumber(type):
 
 
 def GlobalNestedNumber():
-    state.get().nested_number = NESTED_NUMBER
+    state.nested_number = NESTED_NUMBER
 
 
 class IGlobalNestedService(Protocol):
@@ -193,8 +190,6 @@ class SingletonNestedService(ISingletonNestedService):
 
 class ILifetimeService(Protocol):
 
-    index: int
-
     def get_current_item(self) -> int: ...
 
 
@@ -210,34 +205,27 @@ class ILifetimeServiceFactory(ILifetimeService):
     ...
 
 
-class LifetimeServiceSingleton(ILifetimeServiceSingleton):
+class LifetimeService:
+
+    numbers = NUMBERS
 
     def __init__(self) -> None:
-        self.index = 0
+        self.items = iter(self.numbers[1:])
 
     def get_current_item(self) -> int:
-        self.index += 1
-        return NUMBERS[self.index]
-
+        return next(self.items)
 
-class LifetimeServiceScoped(ILifetimeServiceScoped):
-
-    def __init__(self) -> None:
-        self.index = 0
 
-    def get_current_item(self) -> int:
-        self.index += 1
-        return NUMBERS[self.index]
+class LifetimeServiceSingleton(LifetimeService, ILifetimeServiceSingleton):
+    ...
 
 
-class LifetimeServiceFactory(ILifetimeServiceFactory):
+class LifetimeServiceScoped(LifetimeService, ILifetimeServiceScoped):
+    ...
 
-    def __init__(self) -> None:
-        self.index = 0
 
-    def get_current_item(self) -> int:
-        self.index += 1
-        return NUMBERS[self.index]
+class LifetimeServiceFactory(LifetimeService, ILifetimeServiceFactory):
+    ...
     
 
 # --- Integration Dependencies ---
@@ -256,7 +244,7 @@ class IGlobalService2(Protocol):
 
 class GlobalService2(IGlobalService2):
     def __init__(self) -> None:
-        state.get().global_service_number_2 = GLOBAL_SERVICE_NUMBER2
+        state.global_service_number_2 = GLOBAL_SERVICE_NUMBER2
 
 
 
@@ -273,40 +261,27 @@ class OverrideNumberSerivce(INumberService):
 
 class GlobalOverrideService(IGlobalService):
     def __init__(self) -> None:
-        state.get().global_override_number = GLOBAL_OVERRIDE_NUMBER
+        state.global_override_number = GLOBAL_OVERRIDE_NUMBER
 
 
 def get_override_function_number() -> int:
     return OVERRIDE_NUMBER
 
-class LifetimeOverrideServiceSingleton(ILifetimeServiceSingleton):
+class LifetimeOverrideService(LifetimeService):
 
-    def __init__(self) -> None:
-        self.index = 0
+    numbers = OVERRIDE_NUMBERS
 
-    def get_current_item(self) -> int:
-        self.index += 1
-        return OVERRIDE_NUMBERS[self.index]
 
-
-class LifetimeOverrideServiceScoped(ILifetimeServiceScoped):
-
-    def __init__(self) -> None:
-        self.index = 0
-
-    def get_current_item(self) -> int:
-        self.index += 1
-        return OVERRIDE_NUMBERS[self.index]
+class LifetimeOverrideServiceSingleton(LifetimeOverrideService, ILifetimeServiceSingleton):
+    ...
 
 
-class LifetimeOverrideServiceFactory(ILifetimeServiceFactory):
+class LifetimeOverrideServiceScoped(LifetimeOverrideService, ILifetimeServiceScoped):
+    ...
 
-    def __init__(self) -> None:
-        self.index = 0
 
-    def get_current_item(self) -> int:
-        self.index += 1
-        return OVERRIDE_NUMBERS[self.index]
+class LifetimeOverrideServiceFactory(LifetimeOverrideService, ILifetimeServiceFactory):
+    ...
 
 
 # --- Integrity Dependencies ---
@@ -319,7 +294,7 @@ class ExtraText(str): ...
 
 
 def background_task(number: int):
-    state.get().background_number = number
+    state.background_number = number
 
 class DeeperSerivce:
 
@@ -355,6 +330,68 @@ class DeepService:
         return self.aservice.get_id()
     
 
+class IPartialService(Protocol):
+
+    def get_number(self) -> int: ...
+
+    def get_service_number(self) -> int: ...
+
+
+class PartialService(IPartialService):
+
+    amount: Decimal
+    service: INumberService
+
+    def __init__(self, number: INumberService, amount: Decimal | None = None) -> None:
+        self.number = number
+
+    def get_number(self) -> int:
+        return self.number.get_number()
+
+    def get_service_number(self) -> int:
+        return self.service.get_number()
+
+
+# --- Circular Dependencies ---
+
+
+class ICircularFirst(Protocol): ...
+
+
+class ICircularSecond(Protocol): ...
+
+
+class CircularFirst(ICircularFirst):
+
+    def __init__(self, second: ICircularSecond) -> None: ...
+
+
+class CircularSecond(ICircularSecond):
+
+    def __init__(self, first: ICircularFirst) -> None: ...
+
+
+# --- Reset Dependencies ---
+
+
+class IResetNumber(Protocol): ...
+
+
+class IResetService(Protocol): ...
+
+
+class ResetNumber(IResetNumber): ...
+
+
+class ResetPlaceholderService(IResetService): ...
+
+
+class ResetService(IResetService):
+
+    def __init__(self, number: IResetNumber) -> None:
+        self.number = number
+
+
 # --- Dispose Dependencies ---
 
 
@@ -366,4 +403,4 @@ class IDisposable(Protocol):
 class Disposable(IDisposable):
 
     async def __dispose__(self):
-        state.get().dispose_number = DISPOSE_NUMBER
\ No newline at end of file
+        state.dispose_number = DISPOSE_NUMBER
\ No newline at end of file
@@ -1,3 +1,5 @@
+import gc
+import weakref
 from typing import Any, Annotated
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -41,5 +43,73 @@ def test_controller(state: State, app: FastAPI, client: TestClient, container: C
     assert data['srv'] == SERVICE_NUMBER
     assert data['nst'] == NESTED_NUMBER
     assert data['num'] == FUNCTION_NUMBER
-    assert state.get().global_service_number == GLOBAL_SERVICE_NUMBER
-    assert state.get().global_service_number_2 == GLOBAL_SERVICE_NUMBER2
+    assert state.global_service_number == GLOBAL_SERVICE_NUMBER
+    assert state.global_service_number_2 == GLOBAL_SERVICE_NUMBER2
+
+
+# --- Controller Multiple Routers Test
+def test_controller_routers(app: FastAPI, client: TestClient, container: Container):
+
+    class TestController(APIController):
+        config = {
+            'container': container
+        }
+
+        @get('/test')
+        async def endpoint(self, service: INumberService) -> int:
+            return service.get_number()
+
+    app.include_router(TestController.router({'prefix': '/first'}))
+    app.include_router(TestController.router({'prefix': '/second'}))
+
+    response = client.get('/first/test')
+    response2 = client.get('/second/test')
+
+    assert response.status_code == response2.status_code == 200
+    assert response.json() == response2.json() == SERVICE_NUMBER
+
+
+# --- Controller Config Test
+def test_controller_config(container: Container):
+
+    class TestController(APIController):
+        config = {
+            'prefix': '/ctrl',
+            'container': container
+        }
+
+    router = TestController.router({'prefix': '/other'})
+
+    assert router.container is container  # Container is shared, not copied
+    assert router.prefix == '/other'
+    assert TestController.config == {'prefix': '/ctrl', 'container': container}
+
+    class DefaultController(APIController):
+        config = {
+            'prefix': '/default'
+        }
+
+    default_router = DefaultController.router()  # No container configured
+
+    assert default_router.prefix == '/default'
+    assert default_router.container is not DefaultController.router().container  # Fallback containers are not shared
+
+# --- Controller Garbage Collection Test
+def test_controller_collected():
+
+    def create_controller() -> weakref.ref[type[APIController]]:
+
+        class TemporaryController(APIController):
+            config = {'prefix': '/temporary'}
+
+            @get('/')
+            def endpoint(self) -> int:  # pyright: ignore[reportUnusedFunction]
+                return 0
+
+        TemporaryController.router()
+        return weakref.ref(TemporaryController)
+
+    controller = create_controller()
+    gc.collect()
+
+    assert controller() is None  # Cached routes do not keep the controller alive
@@ -28,4 +28,4 @@ def test_dispose(state: State, container: Container):
         response = client.get('/')
 
     assert response.status_code == 200
-    assert state.get().dispose_number == DISPOSE_NUMBER
\ No newline at end of file
+    assert state.dispose_number == DISPOSE_NUMBER
\ No newline at end of file
@@ -40,4 +40,34 @@ def test_hook():
     data = response.json()
 
     assert response.status_code == 200
-    assert data == register_number == resolve_number == SERVICE_NUMBER
\ No newline at end of file
+    assert data == register_number == resolve_number == SERVICE_NUMBER
+# --- Wrapping Resolve Hook Test (Singleton)
+def test_wrapping_hook():
+    app = FastAPI()
+
+    calls: int = 0
+
+    def resolve_hook(dependency: Depends):
+        original = dependency.dependency
+        def wrapper():
+            nonlocal calls
+            calls += 1
+            return original()  # pyright: ignore[reportOptionalCall]
+        return Depends(wrapper, use_cache=dependency.use_cache)
+
+    app.container.before_resolve_hook = resolve_hook
+
+    app.add_singleton(INumberService, NumberService)
+
+
+    @app.get('/test')
+    async def endpoint(service: INumberService) -> int:  # pyright: ignore[reportUnusedFunction]
+        return service.get_number()
+    
+    client = TestClient(app)
+
+    response = client.get('/test')
+
+    assert response.status_code == 200
+    assert response.json() == SERVICE_NUMBER
+    assert calls == 1
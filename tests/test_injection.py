@@ -35,10 +35,10 @@ def test_app_endpoint(app: FastAPI, client: TestClient, state: State):
     assert data['srv'] == SERVICE_NUMBER  # Inject class instance as dependency 
     assert data['gnr'] == GENERATOR_NUMBER  # Inject generator as dependency
     assert data['n1'] == data['n2'] == data['n3'] == FUNCTION_NUMBER  # Inject function as dependency (n1) + Resolve dependency from annotations (n2) + Use FastAPI dependencies alongside FastIoC deps (n3)
-    assert state.get().global_service_number == GLOBAL_SERVICE_NUMBER  # Class instance injection in POD (Path Operation Decorator) 
-    assert state.get().global_direct_number == GLOBAL_FUNCTION_NUMBER  # Function injection in POD
-    assert state.get().global_usual_number == GLOBAL_USUAL_NUMBER  # Use FastAPI dependencies in POD alongside FastIoC deps 
-    assert state.get().generator_exit_number == GENERATOR_EXIT_NUMBER  # Ensure that clean-up block of generator works
+    assert state.global_service_number == GLOBAL_SERVICE_NUMBER  # Class instance injection in POD (Path Operation Decorator) 
+    assert state.global_direct_number == GLOBAL_FUNCTION_NUMBER  # Function injection in POD
+    assert state.global_usual_number == GLOBAL_USUAL_NUMBER  # Use FastAPI dependencies in POD alongside FastIoC deps 
+    assert state.generator_exit_number == GENERATOR_EXIT_NUMBER  # Ensure that clean-up block of generator works
 
 
 # --- Router Endpoint Test (Sync) ---
@@ -59,7 +59,7 @@ def test_router_endpoint(app: FastAPI, router: APIRouter, client: TestClient, st
     assert response.status_code == 200
     assert data['txt'] == QUERY_TEXT # Query parameter
     assert data['srv'] == SERVICE_NUMBER # Simple dependency
-    assert state.get().global_service_number == GLOBAL_SERVICE_NUMBER # Endpoint passive dependency
+    assert state.global_service_number == GLOBAL_SERVICE_NUMBER # Endpoint passive dependency
 
 # --- Application / Router Passive Dependencies Test ---
 def test_passive(state: State, container: Container):
@@ -83,7 +83,31 @@ def test_passive(state: State, container: Container):
     
     assert response.status_code == 200
     assert response.json() == QUERY_TEXT
-    assert state.get().global_direct_number == GLOBAL_FUNCTION_NUMBER
-    assert state.get().global_usual_number == GLOBAL_USUAL_NUMBER
-    assert state.get().global_service_number == GLOBAL_SERVICE_NUMBER
-    assert state.get().global_service_number_2 == GLOBAL_SERVICE_NUMBER2
\ No newline at end of file
+    assert state.global_direct_number == GLOBAL_FUNCTION_NUMBER
+    assert state.global_usual_number == GLOBAL_USUAL_NUMBER
+    assert state.global_service_number == GLOBAL_SERVICE_NUMBER
+    assert state.global_service_number_2 == GLOBAL_SERVICE_NUMBER2
+
+# --- Try Resolve Test ---
+def test_try_resolve(container: Container):
+
+    assert container.try_resolve(INumberService) is container.resolve(INumberService)
+    assert container.try_resolve(int) is None
+
+
+# --- Optional Parameter Test ---
+def test_optional_parameter(app: FastAPI, client: TestClient):
+
+    @app.get('/test')
+    async def endpoint(service: INumberService, text: str | None = None) -> dict[str, Any]:  # pyright: ignore[reportUnusedFunction]
+        return {
+            'txt': text,
+            'srv': service.get_number()
+        }
+
+    response = client.get('/test', params={'text': QUERY_TEXT})
+    data = response.json()
+
+    assert response.status_code == 200
+    assert data['txt'] == QUERY_TEXT
+    assert data['srv'] == SERVICE_NUMBER
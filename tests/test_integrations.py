@@ -50,9 +50,9 @@
 #     assert data['txt'] == QUERY_TEXT # Simple query parameter
 #     assert data['num'] == SERVICE_NUMBER # Simple dependency
 #     assert data['lzy'] == LAZY_NUMBER # Added afterwards dependency
-#     assert state.get().global_service_number == GLOBAL_SERVICE_NUMBER # Global application dependecny (FastIoC)
-#     assert state.get().global_service_number_2 == GLOBAL_SERVICE_NUMBER2 # Endpoint passive dependecny
-#     assert state.get().global_usual_number ==  GLOBAL_USUAL_NUMBER # Global application dependency (FastAPI)
+#     assert state.global_service_number == GLOBAL_SERVICE_NUMBER # Global application dependecny (FastIoC)
+#     assert state.global_service_number_2 == GLOBAL_SERVICE_NUMBER2 # Endpoint passive dependecny
+#     assert state.global_usual_number ==  GLOBAL_USUAL_NUMBER # Global application dependency (FastAPI)
 
 #     # Make sure simple router works correctly
 #     assert response2.status_code == 200
@@ -112,8 +112,8 @@
 #     assert data['num'] == idata['num'] == LAZY_NUMBER
 #     assert data['srv'] == idata['srv'] == SERVICE_NUMBER
 #     assert data2['num'] == idata2['num'] == FUNCTION_NUMBER
-#     assert state.get().global_service_number == GLOBAL_SERVICE_NUMBER
-#     assert state.get().global_usual_number == GLOBAL_USUAL_NUMBER
+#     assert state.global_service_number == GLOBAL_SERVICE_NUMBER
+#     assert state.global_usual_number == GLOBAL_USUAL_NUMBER
 
 # # --- Container Replacement Test
 # def test_change_container(container: Container):
@@ -177,7 +177,7 @@
 #     assert response.status_code == 200
 #     assert data['srv'] == OVERRIDE_SERVICE_NUMBER
 #     assert data['num'] == OVERRIDE_NUMBER
-#     assert state.get().global_override_number == GLOBAL_OVERRIDE_NUMBER
+#     assert state.global_override_number == GLOBAL_OVERRIDE_NUMBER
 
 # # --- Dispose Test
 # def test_dispose(state: State, container: Container):
@@ -197,4 +197,4 @@
 #         response = client.get('/')
 
 #     assert response.status_code == 200
-#     assert state.get().dispose_number == DISPOSE_NUMBER
\ No newline at end of file
+#     assert state.dispose_number == DISPOSE_NUMBER
\ No newline at end of file
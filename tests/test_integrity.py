@@ -1,10 +1,15 @@
-from typing import Any, Annotated
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Annotated
 
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from .dependencies import ExtraText, DeepService, State
-from .constants import QUERY_TEXT, COOKIE_NUMBER, BACKGROUND_NUMBER
+from .dependencies import ExtraText, DeepService, State, IPartialService
+from .constants import QUERY_TEXT, COOKIE_NUMBER, BACKGROUND_NUMBER, SERVICE_NUMBER
+
+if TYPE_CHECKING:
+    from decimal import Decimal
 
 # --- Endpoint Parameters Test
 def test_parameter(state: State , app: FastAPI, client: TestClient):
@@ -26,4 +31,20 @@ def test_parameter(state: State , app: FastAPI, client: TestClient):
     assert response.status_code == 200
     assert data['txt'] == QUERY_TEXT
     assert data['id'] == data['srv'] == data['dep'] == data['cki'] == data['ann'] == COOKIE_NUMBER
-    assert state.get().background_number == BACKGROUND_NUMBER
\ No newline at end of file
+    assert state.background_number == BACKGROUND_NUMBER
+
+# --- Unresolvable Annotation Test
+def test_unresolvable_annotation(app: FastAPI, client: TestClient):
+
+    @app.get('/test')
+    async def endpoint(service: IPartialService, amount: Decimal | None = None) -> dict[str, Any]:  # pyright: ignore[reportUnusedFunction]
+        return {
+            'n1': service.get_number(),
+            'n2': service.get_service_number(),
+        }
+
+    response = client.get('/test')
+    data = response.json()
+
+    assert response.status_code == 200
+    assert data['n1'] == data['n2'] == SERVICE_NUMBER
@@ -1,9 +1,19 @@
+from __future__ import annotations
+
+import inspect
 from typing import Any, Annotated
 
+import pytest
+
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from .dependencies import ILifetimeServiceSingleton, ILifetimeServiceScoped, ILifetimeServiceFactory, ILifetimeService
+from fastioc.container import Container
+from fastioc.errors import UnregisteredProtocolError, CircularDependencyError
+
+from .dependencies import (ILifetimeServiceSingleton, ILifetimeServiceScoped, ILifetimeServiceFactory, ILifetimeService,
+                           IResetNumber, IResetService, ResetNumber, ResetPlaceholderService, ResetService,
+                           ICircularFirst, ICircularSecond, CircularFirst, CircularSecond)
 from .constants import NUMBERS
 
 # --- Lifetime Test
@@ -26,4 +36,46 @@ def test_lifetime(app: FastAPI, client: TestClient):
 
     assert response.status_code == _response.status_code == 200
     assert data['t1'] == data['t2'] == _data['t1'] == _data['t2'] == data['r1'] == _data['r1'] == data['s'] == NUMBERS[1]
-    assert data['r2'] == _data['r2'] == _data['s'] == NUMBERS[2]
\ No newline at end of file
+    assert data['r2'] == _data['r2'] == _data['s'] == NUMBERS[2]
+
+# --- Singleton Provider Test
+def test_singleton_provider(container: Container):
+
+    provider = container.resolve(ILifetimeServiceSingleton).dependency
+    instance = container.get_singleton(ILifetimeServiceSingleton)
+
+    assert not inspect.iscoroutinefunction(provider)
+    assert provider() is instance  # pyright: ignore[reportOptionalCall]
+
+    with pytest.raises(UnregisteredProtocolError):
+        container.get_singleton(ILifetimeServiceScoped)
+
+# --- Reset Singletons After Re-registration Test
+def test_reset_singletons_reregistered():
+
+    container = Container()
+    container.add_singleton(IResetService, ResetPlaceholderService)
+    container.add_singleton(IResetNumber, ResetNumber)
+    container.add_singleton(IResetService, ResetService)  # Now depends on the later registered IResetNumber
+
+    container.reset_singletons()
+
+    service = container.get_singleton(IResetService)
+    assert isinstance(service, ResetService)
+    assert service.number is container.get_singleton(IResetNumber)
+
+# --- Failed Re-registration Keeps Singleton Test
+def test_failed_reregistration_keeps_singleton():
+
+    container = Container()
+    container.add_scoped(ICircularFirst, CircularFirst)
+    container.add_scoped(ICircularSecond, CircularSecond)  # CircularSecond -> CircularFirst
+    container.add_singleton(ICircularFirst, ResetNumber)
+    singleton = container.get_singleton(ICircularFirst)
+
+    with pytest.raises(CircularDependencyError):
+        container.add_scoped(ICircularFirst, CircularFirst)  # CircularFirst -> CircularSecond -> CircularFirst
+
+    container.reset_singletons()
+    assert isinstance(container.get_singleton(ICircularFirst), ResetNumber)
+    assert container.get_singleton(ICircularFirst) is not singleton
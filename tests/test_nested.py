@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from typing import Any, Annotated
 import pytest
 
@@ -5,9 +7,10 @@ from fastapi import FastAPI, Depends
 from fastapi.testclient import TestClient
 
 from fastioc.container import Container
-from fastioc.errors import SingletonLifetimeViolationError, SingletonGeneratorError
+from fastioc.errors import SingletonLifetimeViolationError, SingletonGeneratorError, CircularDependencyError
 
-from .dependencies import State, INestedService, IGlobalNestedService, DependentNestedNumber, get_dependent_nested_number, NestedService, ISingletonNestedService
+from .dependencies import (State, INestedService, IGlobalNestedService, DependentNestedNumber, get_dependent_nested_number, NestedService, ISingletonNestedService,
+                           ICircularFirst, ICircularSecond, CircularFirst, CircularSecond)
 from .constants import QUERY_TEXT, SERVICE_NUMBER, NESTED_NUMBER, SERVICE_NUMBER_2
 
 # --- Nested Dependencies Test
@@ -30,7 +33,7 @@ def test_nested(app: FastAPI, client: TestClient, state: State):
     
     assert response.status_code == 200, data
     assert data['n2'] == SERVICE_NUMBER
-    assert data['n1'] == data['n3'] == data['n4'] == data['n5'] == state.get().nested_number == NESTED_NUMBER
+    assert data['n1'] == data['n3'] == data['n4'] == data['n5'] == state.nested_number == NESTED_NUMBER
     assert data['n6'] == SERVICE_NUMBER_2
     assert data['txt'] == QUERY_TEXT
 
@@ -59,3 +62,13 @@ def test_nested_singleton(app: FastAPI, client: TestClient, container: Container
     assert response.status_code == 200
     assert data['n1'] == data['n2'] == SERVICE_NUMBER_2
     assert data['txt'] == QUERY_TEXT
+
+# --- Circular Dependency Error Test
+def test_circular_dependency():
+
+    container = Container()
+    container.add_scoped(ICircularFirst, CircularFirst)
+    container.add_scoped(ICircularSecond, CircularSecond)
+
+    with pytest.raises(CircularDependencyError):
+        container.add_scoped(ICircularFirst, CircularFirst)
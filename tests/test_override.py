@@ -36,7 +36,7 @@ def test_override(state: State, app: FastAPI, client: TestClient, container: Con
     assert response.status_code == 200
     assert data['srv'] == OVERRIDE_SERVICE_NUMBER
     assert data['num'] == OVERRIDE_NUMBER
-    assert state.get().global_override_number == GLOBAL_OVERRIDE_NUMBER
+    assert state.global_override_number == GLOBAL_OVERRIDE_NUMBER
 
 # --- Override with Lifetime Test
 def test_override_lifetime(app: FastAPI, client: TestClient, container: Container):